@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, Tuple, cast
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 
 from xrpl.clients import JsonRpcClient
 from xrpl.models import XRP, Currency, IssuedCurrency, XChainBridge
@@ -12,18 +13,37 @@ from sidechain_cli.utils.config_file.config_item import ConfigItem
 from sidechain_cli.utils.types import CurrencyDict
 
 
-def _to_issued_currency(xchain_currency: CurrencyDict) -> Currency:
+@lru_cache(maxsize=128)
+def _currency_from_items(items: Tuple[Tuple[str, str], ...]) -> Currency:
+    xchain_currency: Dict[str, Any] = dict(items)
     return (
         XRP()
         if XRP.is_dict_of_model(xchain_currency)
-        else IssuedCurrency.from_dict(cast(Dict[str, Any], xchain_currency))
+        else IssuedCurrency.from_dict(xchain_currency)
     )
 
 
+def _to_issued_currency(xchain_currency: CurrencyDict) -> Currency:
+    # the models are immutable, so the same object can be shared by every bridge
+    # with that currency
+    return _currency_from_items(tuple(sorted(xchain_currency.items())))
+
+
 @dataclass
 class BridgeConfig(ConfigItem):
     """Object representing the config for a bridge."""
 
+    __slots__ = (
+        "name",
+        "chains",
+        "quorum",
+        "door_accounts",
+        "xchain_currencies",
+        "signature_reward",
+        "create_account_amounts",
+        "_clients",
+    )
+
     name: str
     chains: Tuple[str, str]
     quorum: int
@@ -32,6 +52,30 @@ class BridgeConfig(ConfigItem):
     signature_reward: str
     create_account_amounts: Tuple[Optional[str], Optional[str]]
 
+    def __post_init__(self: BridgeConfig) -> None:
+        """Initialize the cached clients."""
+        self._clients: Optional[Tuple[JsonRpcClient, JsonRpcClient]] = None
+
+    @property
+    def locking_issue(self: BridgeConfig) -> Currency:
+        """
+        Get the currency that the bridge transfers on the locking chain.
+
+        Returns:
+            The locking chain's currency, as an xrpl-py model.
+        """
+        return _to_issued_currency(self.xchain_currencies[0])
+
+    @property
+    def issuing_issue(self: BridgeConfig) -> Currency:
+        """
+        Get the currency that the bridge transfers on the issuing chain.
+
+        Returns:
+            The issuing chain's currency, as an xrpl-py model.
+        """
+        return _to_issued_currency(self.xchain_currencies[1])
+
     def get_clients(self: BridgeConfig) -> Tuple[JsonRpcClient, JsonRpcClient]:
         """
         Get the clients for the chains associated with the bridge.
@@ -39,7 +83,12 @@ class BridgeConfig(ConfigItem):
         Returns:
             The clients for the chains associated with the bridge.
         """
-        return (JsonRpcClient(self.chains[0]), JsonRpcClient(self.chains[1]))
+        if self._clients is None:
+            self._clients = (
+                JsonRpcClient(self.chains[0]),
+                JsonRpcClient(self.chains[1]),
+            )
+        return self._clients
 
     def get_bridge(self: BridgeConfig) -> XChainBridge:
         """
@@ -48,13 +97,11 @@ class BridgeConfig(ConfigItem):
         Returns:
             The XChainBridge object.
         """
-        locking_chain_issue = _to_issued_currency(self.xchain_currencies[0])
-        issuing_chain_issue = _to_issued_currency(self.xchain_currencies[1])
         return XChainBridge(
             locking_chain_door=self.door_accounts[0],
-            locking_chain_issue=locking_chain_issue,
+            locking_chain_issue=self.locking_issue,
             issuing_chain_door=self.door_accounts[1],
-            issuing_chain_issue=issuing_chain_issue,
+            issuing_chain_issue=self.issuing_issue,
         )
 
     def to_xrpl(self: BridgeConfig) -> Dict[str, Any]:
@@ -64,9 +111,12 @@ class BridgeConfig(ConfigItem):
         Returns:
             The XRPL-formatted dictionary for the XChainBridge object.
         """
+        # the currencies are already in XRPL format, so there's no need to go through
+        # the xrpl-py models. They're copied because they're shared with the cached
+        # config file data.
         return {
             "LockingChainDoor": self.door_accounts[0],
-            "LockingChainIssue": self.xchain_currencies[0],
+            "LockingChainIssue": dict(self.xchain_currencies[0]),
             "IssuingChainDoor": self.door_accounts[1],
-            "IssuingChainIssue": self.xchain_currencies[1],
+            "IssuingChainIssue": dict(self.xchain_currencies[1]),
         }
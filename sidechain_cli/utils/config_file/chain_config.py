@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Optional
 
 from xrpl.clients import JsonRpcClient
 
@@ -14,9 +15,15 @@ from sidechain_cli.utils.rippled_config import RippledConfig
 class ChainConfig(ServerConfig):
     """Object representing the config for a chain."""
 
+    __slots__ = ("ws_ip", "ws_port", "_client")
+
     ws_ip: str
     ws_port: int
 
+    def __post_init__(self: ChainConfig) -> None:
+        """Initialize the cached client."""
+        self._client: Optional[JsonRpcClient] = None
+
     @property
     def rippled(self: ChainConfig) -> str:
         """
@@ -34,7 +41,9 @@ class ChainConfig(ServerConfig):
         Returns:
             A JsonRpcClient that is connected to this chain.
         """
-        return JsonRpcClient(f"http://{self.http_ip}:{self.http_port}")
+        if self._client is None:
+            self._client = JsonRpcClient(f"http://{self.http_ip}:{self.http_port}")
+        return self._client
 
     def get_config(self: ChainConfig) -> RippledConfig:
         """
@@ -2,17 +2,17 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import os
-from dataclasses import asdict
 from pathlib import Path
-from typing import Any, Dict, List, Type
+from typing import Any, Dict, List, Optional, Type, TypeVar
 
 import httpx
 
 from sidechain_cli.exceptions import SidechainCLIException
 from sidechain_cli.utils.config_file.bridge_config import BridgeConfig
 from sidechain_cli.utils.config_file.chain_config import ChainConfig
+from sidechain_cli.utils.config_file.json_cache import load_json, write_json
 from sidechain_cli.utils.config_file.server_config import ServerConfig
 from sidechain_cli.utils.config_file.witness_config import WitnessConfig
 from sidechain_cli.utils.types import ServerData
@@ -24,17 +24,24 @@ CONFIG_FOLDER = os.path.join(_HOME, ".config", "sidechain-cli")
 # ~/.config/sidechain-cli/config.json
 _CONFIG_FILE = os.path.join(CONFIG_FOLDER, "config.json")
 
-# Initialize config file
-Path(CONFIG_FOLDER).mkdir(parents=True, exist_ok=True)
-if not os.path.exists(_CONFIG_FILE):
-    with open(_CONFIG_FILE, "w") as f:
-        data: Dict[str, Any] = {"chains": [], "witnesses": [], "bridges": []}
-        json.dump(data, f, indent=4)
+# How long to wait for a server to respond before assuming it isn't running
+_PROBE_TIMEOUT = 2.0
+
+# How long to wait for a server's port to accept a connection
+_CONNECT_TIMEOUT = 0.25
 
 # TODO: consider having separate JSONs for each node type
 # (e.g. chains.json, witnesses.json, bridges.json)
 
 
+def _ensure_config_exists() -> None:
+    # this isn't done at import time, so that importing the CLI doesn't touch the
+    # filesystem (and so that tests can redirect the config folder first)
+    Path(CONFIG_FOLDER).mkdir(parents=True, exist_ok=True)
+    if not os.path.exists(_CONFIG_FILE):
+        write_json(_CONFIG_FILE, {"chains": [], "witnesses": [], "bridges": []})
+
+
 def get_config_folder() -> str:
     """
     Get the folder in which all of the CLI config data is located.
@@ -42,26 +49,91 @@ def get_config_folder() -> str:
     Returns:
         The full name of the config folder.
     """
+    _ensure_config_exists()
     return CONFIG_FOLDER
 
 
-def _get_running_processes(servers: List[ServerData]) -> List[ServerData]:
-    return_list = []
-    for server in servers:
-        http_url = f"http://{server['http_ip']}:{server['http_port']}"
-        try:
-            request = {"method": "server_info"}
-            httpx.post(http_url, json=request)
-            return_list.append(server)
-            continue
-        except (
-            httpx.ConnectError,
-            httpx.RemoteProtocolError,
-            httpx.ReadError,
-            httpx.WriteError,
-        ):
-            continue
-    return return_list
+def _needs_http_probe(server: ServerData, deep: bool) -> bool:
+    # docker's port forwarding accepts connections even if nothing is listening in
+    # the container, so an open port doesn't mean that a docker server is running
+    return deep or server["exe"] == "docker"
+
+
+async def _probe_port(server: ServerData) -> bool:
+    try:
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(server["http_ip"], server["http_port"]),
+            _CONNECT_TIMEOUT,
+        )
+        writer.close()
+        await writer.wait_closed()
+        return True
+    except (OSError, asyncio.TimeoutError):
+        return False
+
+
+async def _probe_http(server: ServerData, client: httpx.AsyncClient) -> bool:
+    http_url = f"http://{server['http_ip']}:{server['http_port']}"
+    try:
+        request = {"method": "server_info"}
+        await client.post(http_url, json=request)
+        return True
+    except (
+        httpx.ConnectError,
+        httpx.ConnectTimeout,
+        httpx.RemoteProtocolError,
+        httpx.ReadError,
+        httpx.WriteError,
+    ):
+        return False
+    except httpx.TimeoutException:
+        # the server accepted the connection but is slow to answer, so it's still
+        # running
+        return True
+
+
+async def _probe_all(servers: List[ServerData], deep: bool) -> List[bool]:
+    if not any(_needs_http_probe(server, deep) for server in servers):
+        return await asyncio.gather(*[_probe_port(server) for server in servers])
+
+    async with httpx.AsyncClient(timeout=_PROBE_TIMEOUT) as client:
+        return await asyncio.gather(
+            *[
+                _probe_http(server, client)
+                if _needs_http_probe(server, deep)
+                else _probe_port(server)
+                for server in servers
+            ]
+        )
+
+
+def _check_running(servers: List[ServerData], deep: bool = False) -> List[bool]:
+    """
+    Check which of a list of servers are currently running.
+
+    By default, a server counts as running if its HTTP port accepts a connection.
+
+    Args:
+        servers: The servers to check.
+        deep: Whether to send each server an actual `server_info` request instead.
+            This always happens for servers running on docker.
+
+    Returns:
+        Whether each server is running, in the same order as `servers`.
+    """
+    if len(servers) == 0:
+        return []
+    # all of the servers are probed concurrently, so this only takes as long as the
+    # slowest response
+    return asyncio.run(_probe_all(servers, deep))
+
+
+_T = TypeVar("_T", ChainConfig, WitnessConfig, BridgeConfig)
+
+
+def _index_by_name(items: List[_T]) -> Dict[str, _T]:
+    # if there are duplicate names, the first item with that name wins
+    return {item.name: item for item in reversed(items)}
 
 
 class ConfigFile:
@@ -71,19 +143,99 @@ class ConfigFile:
         """
         Initialize a ConfigFile object.
 
+        The chains, witnesses, and bridges aren't loaded until they're first used, so
+        the servers are only checked for liveness if they're actually needed.
+
         Args:
             data: The dictionary with the config data.
         """
-        self.chains = [
-            ChainConfig.from_dict(chain)
-            for chain in _get_running_processes(data["chains"])
-        ]
-        self.witnesses = [
-            WitnessConfig.from_dict(witness)
-            for witness in _get_running_processes(data["witnesses"])
-        ]
-        self.bridges = [BridgeConfig.from_dict(bridge) for bridge in data["bridges"]]
-        self.write_to_file()
+        self._data = data
+        self._chains: Optional[List[ChainConfig]] = None
+        self._witnesses: Optional[List[WitnessConfig]] = None
+        self._bridges: Optional[List[BridgeConfig]] = None
+        self._chain_index: Optional[Dict[str, ChainConfig]] = None
+        self._witness_index: Optional[Dict[str, WitnessConfig]] = None
+        self._bridge_index: Optional[Dict[str, BridgeConfig]] = None
+
+    def _load_servers(self: ConfigFile) -> None:
+        chain_data = self._data["chains"]
+        witness_data = self._data["witnesses"]
+        # chains and witnesses are probed together in one batch, and then split back
+        # up by position
+        is_running = _check_running(chain_data + witness_data)
+        chains_running = is_running[: len(chain_data)]
+        witnesses_running = is_running[len(chain_data) :]
+        if self._chains is None:
+            self.chains = [
+                ChainConfig.from_dict(chain)
+                for chain, running in zip(chain_data, chains_running)
+                if running
+            ]
+        if self._witnesses is None:
+            self.witnesses = [
+                WitnessConfig.from_dict(witness)
+                for witness, running in zip(witness_data, witnesses_running)
+                if running
+            ]
+
+        # only rewrite the file if some of the servers are no longer running
+        if not all(is_running):
+            self.write_to_file()
+
+    @property
+    def chains(self: ConfigFile) -> List[ChainConfig]:
+        """
+        The chains that are currently running.
+
+        Returns:
+            The chains that are currently running.
+        """
+        if self._chains is None:
+            self._load_servers()
+            assert self._chains is not None
+        return self._chains
+
+    @chains.setter
+    def chains(self: ConfigFile, chains: List[ChainConfig]) -> None:
+        self._chains = chains
+        self._chain_index = None
+
+    @property
+    def witnesses(self: ConfigFile) -> List[WitnessConfig]:
+        """
+        The witnesses that are currently running.
+
+        Returns:
+            The witnesses that are currently running.
+        """
+        if self._witnesses is None:
+            self._load_servers()
+            assert self._witnesses is not None
+        return self._witnesses
+
+    @witnesses.setter
+    def witnesses(self: ConfigFile, witnesses: List[WitnessConfig]) -> None:
+        self._witnesses = witnesses
+        self._witness_index = None
+
+    @property
+    def bridges(self: ConfigFile) -> List[BridgeConfig]:
+        """
+        The bridges that have been set up.
+
+        Returns:
+            The bridges that have been set up.
+        """
+        if self._bridges is None:
+            self._bridges = [
+                BridgeConfig.from_dict(bridge) for bridge in self._data["bridges"]
+            ]
+        return self._bridges
+
+    @bridges.setter
+    def bridges(self: ConfigFile, bridges: List[BridgeConfig]) -> None:
+        self._bridges = bridges
+        self._bridge_index = None
 
     @classmethod
     def from_file(cls: Type[ConfigFile]) -> ConfigFile:
@@ -93,9 +245,8 @@ class ConfigFile:
         Returns:
             The ConfigFile object.
         """
-        with open(_CONFIG_FILE) as f:
-            data = json.load(f)
-            return cls(data)
+        _ensure_config_exists()
+        return cls(load_json(_CONFIG_FILE))
 
     def get_chain(self: ConfigFile, name: str) -> ChainConfig:
         """
@@ -110,10 +261,12 @@ class ConfigFile:
         Raises:
             SidechainCLIException: if there is no chain with that name.
         """
-        for chain in self.chains:
-            if chain.name == name:
-                return chain
-        raise SidechainCLIException(f"No chain with name {name}.")
+        if self._chain_index is None:
+            self._chain_index = _index_by_name(self.chains)
+        try:
+            return self._chain_index[name]
+        except KeyError:
+            raise SidechainCLIException(f"No chain with name {name}.")
 
     def get_witness(self: ConfigFile, name: str) -> WitnessConfig:
         """
@@ -128,10 +281,12 @@ class ConfigFile:
         Raises:
             SidechainCLIException: if there is no witness with that name.
         """
-        for witness in self.witnesses:
-            if witness.name == name:
-                return witness
-        raise SidechainCLIException(f"No witness with name {name}.")
+        if self._witness_index is None:
+            self._witness_index = _index_by_name(self.witnesses)
+        try:
+            return self._witness_index[name]
+        except KeyError:
+            raise SidechainCLIException(f"No witness with name {name}.")
 
     def get_server(self: ConfigFile, name: str) -> ServerConfig:
         """
@@ -144,15 +299,25 @@ class ConfigFile:
             The ServerConfig object corresponding to that server.
 
         Raises:
-            SidechainCLIException: if there is no server with that name.
+            SidechainCLIException: if there is no server with that name, or if there
+                is both a chain and a witness with that name.
         """
-        for chain in self.chains:
-            if chain.name == name:
-                return chain
-        for witness in self.witnesses:
-            if witness.name == name:
-                return witness
-        raise SidechainCLIException(f"No server with name {name}.")
+        # repeated records of the same kind resolve to the first one, like in
+        # `get_chain` and `get_witness`
+        if self._chain_index is None:
+            self._chain_index = _index_by_name(self.chains)
+        if self._witness_index is None:
+            self._witness_index = _index_by_name(self.witnesses)
+        chain = self._chain_index.get(name)
+        witness = self._witness_index.get(name)
+        if chain is not None and witness is not None:
+            raise SidechainCLIException(
+                f"There is both a chain and a witness with name {name}."
+            )
+        server: Optional[ServerConfig] = chain if chain is not None else witness
+        if server is None:
+            raise SidechainCLIException(f"No server with name {name}.")
+        return server
 
     def get_bridge(self: ConfigFile, name: str) -> BridgeConfig:
         """
@@ -167,10 +332,12 @@ class ConfigFile:
         Raises:
             SidechainCLIException: if there is no bridge with that name.
         """
-        for bridge in self.bridges:
-            if bridge.name == name:
-                return bridge
-        raise SidechainCLIException(f"No bridge with name {name}.")
+        if self._bridge_index is None:
+            self._bridge_index = _index_by_name(self.bridges)
+        try:
+            return self._bridge_index[name]
+        except KeyError:
+            raise SidechainCLIException(f"No bridge with name {name}.")
 
     def to_dict(self: ConfigFile) -> Dict[str, List[Dict[str, Any]]]:
         """
@@ -180,12 +347,12 @@ class ConfigFile:
             A dictionary representing the data in the object.
         """
         return {
-            "chains": [asdict(chain) for chain in self.chains],
-            "witnesses": [asdict(witness) for witness in self.witnesses],
-            "bridges": [asdict(bridge) for bridge in self.bridges],
+            "chains": [chain.to_dict() for chain in self.chains],
+            "witnesses": [witness.to_dict() for witness in self.witnesses],
+            "bridges": [bridge.to_dict() for bridge in self.bridges],
         }
 
     def write_to_file(self: ConfigFile) -> None:
         """Write the ConfigFile data to file."""
-        with open(_CONFIG_FILE, "w") as f:
-            json.dump(self.to_dict(), f, indent=4)
+        _ensure_config_exists()
+        write_json(_CONFIG_FILE, self.to_dict())
@@ -1,14 +1,23 @@
 """Base class for information stored in the CLI."""
 
 from abc import ABC
-from typing import Any, Mapping, Type, TypeVar
+from dataclasses import fields
+from functools import lru_cache
+from typing import Any, Dict, Mapping, Tuple, Type, TypeVar
 
 T = TypeVar("T", bound="ConfigItem")
 
 
+@lru_cache(maxsize=None)
+def _field_names(cls: Type[Any]) -> Tuple[str, ...]:
+    return tuple(field.name for field in fields(cls))
+
+
 class ConfigItem(ABC):
     """Abstract class representing a config item."""
 
+    __slots__ = ()
+
     @classmethod
     def from_dict(cls: Type[T], data: Mapping[str, Any]) -> T:
         """
@@ -21,3 +30,19 @@ class ConfigItem(ABC):
             The associated config object.
         """
         return cls(**data)
+
+    def to_dict(self: T) -> Dict[str, Any]:
+        """
+        Convert a config object to a JSON-serializable dictionary.
+
+        Unlike `dataclasses.asdict`, this doesn't deep-copy the values, so nested
+        values are shared with the config object.
+
+        Returns:
+            The associated dictionary.
+        """
+        data = {}
+        for name in _field_names(type(self)):
+            value = getattr(self, name)
+            data[name] = list(value) if isinstance(value, tuple) else value
+        return data
@@ -0,0 +1,92 @@
+"""Cached reads and atomic writes of the JSON files used by the CLI."""
+
+import json
+import os
+import stat
+import tempfile
+from typing import Any, Dict, Tuple, cast
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+# file name -> (mtime in ns, size in bytes, parsed data)
+_json_cache: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
+
+def _loads(raw: bytes) -> Dict[str, Any]:
+    if _HAS_ORJSON:
+        return cast(Dict[str, Any], orjson.loads(raw))
+    return cast(Dict[str, Any], json.loads(raw))
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    if _HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    # match orjson's output as closely as possible
+    return json.dumps(
+        data, indent=2, separators=(",", ": "), ensure_ascii=False
+    ).encode()
+
+
+def _file_mode(file_name: str) -> int:
+    try:
+        return stat.S_IMODE(os.stat(file_name).st_mode)
+    except FileNotFoundError:
+        # there's no way to read the umask without also setting it
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def load_json(file_name: str) -> Dict[str, Any]:
+    """
+    Load a JSON file, reusing the previously parsed data if the file hasn't changed.
+
+    The returned data is shared between callers, so it should not be modified.
+
+    Args:
+        file_name: The name of the JSON file.
+
+    Returns:
+        The parsed contents of the file.
+    """
+    file_stat = os.stat(file_name)
+    cached = _json_cache.get(file_name)
+    if cached is not None and cached[:2] == (file_stat.st_mtime_ns, file_stat.st_size):
+        return cached[2]
+    with open(file_name, "rb") as f:
+        data = _loads(f.read())
+    _json_cache[file_name] = (file_stat.st_mtime_ns, file_stat.st_size, data)
+    return data
+
+
+def write_json(file_name: str, data: Dict[str, Any]) -> None:
+    """
+    Write data to a JSON file. The file is replaced atomically, so it is never left
+    partially written.
+
+    The data is also cached, so that the next load of that file doesn't need to parse
+    it again.
+
+    Args:
+        file_name: The name of the JSON file.
+        data: The data to write to the file.
+    """
+    fd, temp_file_name = tempfile.mkstemp(dir=os.path.dirname(file_name), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_dumps(data))
+        # mkstemp creates the file as 0600, so give it the permissions that the file
+        # would have had if it had been written directly
+        os.chmod(temp_file_name, _file_mode(file_name))
+        os.replace(temp_file_name, file_name)
+    finally:
+        # the temp file is only still around if something went wrong
+        if os.path.exists(temp_file_name):
+            os.unlink(temp_file_name)
+    file_stat = os.stat(file_name)
+    _json_cache[file_name] = (file_stat.st_mtime_ns, file_stat.st_size, data)
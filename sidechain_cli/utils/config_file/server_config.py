@@ -12,6 +12,8 @@ from sidechain_cli.utils.config_file.config_item import ConfigItem
 class ServerConfig(ConfigItem):
     """Object representing the config for a server (chain/witness)."""
 
+    __slots__ = ("name", "type", "pid", "exe", "config", "http_ip", "http_port")
+
     name: str
     type: Union[Literal["rippled"], Literal["witness"]]
     pid: int
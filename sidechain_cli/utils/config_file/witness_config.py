@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
-from typing import Any, Dict, cast
+from typing import Any, Dict
 
+from sidechain_cli.utils.config_file.json_cache import load_json
 from sidechain_cli.utils.config_file.server_config import ServerConfig
 
 
@@ -13,6 +13,8 @@ from sidechain_cli.utils.config_file.server_config import ServerConfig
 class WitnessConfig(ServerConfig):
     """Object representing the config for a witness."""
 
+    __slots__ = ()
+
     @property
     def witnessd(self: WitnessConfig) -> str:
         """
@@ -27,8 +29,10 @@ class WitnessConfig(ServerConfig):
         """
         Get the config file for this witness.
 
+        The file is only parsed again if it has changed since the last call, so the
+        returned dictionary is shared and should not be modified.
+
         Returns:
             The JSON dictionary for this config file.
         """
-        with open(self.config) as f:
-            return cast(Dict[str, Any], json.load(f))
+        return load_json(self.config)
@@ -103,7 +103,9 @@ def add_chain(chain_data: ChainData) -> None:
         chain_data: The data of the chain to add.
     """
     conf = get_config()
-    conf.chains.append(ChainConfig.from_dict(cast(Dict[str, Any], chain_data)))
+    conf.chains = conf.chains + [
+        ChainConfig.from_dict(cast(Dict[str, Any], chain_data))
+    ]
     conf.write_to_file()
 
 
@@ -138,7 +140,9 @@ def add_witness(witness_data: WitnessData) -> None:
         witness_data: The data of the witness to add.
     """
     conf = get_config()
-    conf.witnesses.append(WitnessConfig.from_dict(cast(Dict[str, Any], witness_data)))
+    conf.witnesses = conf.witnesses + [
+        WitnessConfig.from_dict(cast(Dict[str, Any], witness_data))
+    ]
     conf.write_to_file()
 
 
@@ -204,7 +208,9 @@ def add_bridge(bridge_data: BridgeData) -> None:
         bridge_data: The data of the bridge to add.
     """
     conf = get_config()
-    conf.bridges.append(BridgeConfig.from_dict(cast(Dict[str, Any], bridge_data)))
+    conf.bridges = conf.bridges + [
+        BridgeConfig.from_dict(cast(Dict[str, Any], bridge_data))
+    ]
     conf.write_to_file()
 
 
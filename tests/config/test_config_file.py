@@ -0,0 +1,93 @@
+import json
+import socket
+
+import pytest
+
+from sidechain_cli.exceptions import SidechainCLIException
+from sidechain_cli.utils.config_file import ChainConfig, ConfigFile, WitnessConfig
+from sidechain_cli.utils.config_file import config_file as config_file_module
+from tests.config.utils import CHAIN_DATA, WITNESS_DATA
+
+
+def _config_file(chains, witnesses):
+    config = ConfigFile({"chains": [], "witnesses": [], "bridges": []})
+    # set the servers directly, so that they aren't probed
+    config.chains = [ChainConfig.from_dict(chain) for chain in chains]
+    config.witnesses = [WitnessConfig.from_dict(witness) for witness in witnesses]
+    return config
+
+
+class TestConfigFile:
+    def test_get_server(self):
+        config = _config_file([CHAIN_DATA], [WITNESS_DATA])
+        assert config.get_server("locking_chain") is config.chains[0]
+        assert config.get_server("witness0") is config.witnesses[0]
+        with pytest.raises(SidechainCLIException, match="No server"):
+            config.get_server("issuing_chain")
+
+    def test_get_server_repeated_record(self):
+        repeated_chain = {**CHAIN_DATA, "pid": 4321}
+        config = _config_file([CHAIN_DATA, repeated_chain], [WITNESS_DATA])
+        # the first record wins, the same as in `get_chain`
+        assert config.get_server("locking_chain") is config.chains[0]
+        assert config.get_chain("locking_chain") is config.chains[0]
+
+    def test_get_server_chain_witness_collision(self):
+        colliding_witness = {**WITNESS_DATA, "name": "locking_chain"}
+        config = _config_file([CHAIN_DATA], [WITNESS_DATA, colliding_witness])
+        with pytest.raises(SidechainCLIException, match="both a chain and a witness"):
+            config.get_server("locking_chain")
+        # the kind-specific lookups aren't ambiguous
+        assert config.get_chain("locking_chain") is config.chains[0]
+        assert config.get_witness("locking_chain") is config.witnesses[1]
+        # unique names can still be looked up
+        assert config.get_server("witness0") is config.witnesses[0]
+
+    def test_load_servers_keeps_source_list(self, monkeypatch, tmp_path):
+        config_file = str(tmp_path / "config.json")
+        monkeypatch.setattr(config_file_module, "CONFIG_FOLDER", str(tmp_path))
+        monkeypatch.setattr(config_file_module, "_CONFIG_FILE", config_file)
+        # the second chain isn't running, so the file gets rewritten
+        monkeypatch.setattr(
+            config_file_module,
+            "_check_running",
+            lambda servers: [True, False, True],
+        )
+        mistyped_chain = {**CHAIN_DATA, "type": "witness"}
+        dead_chain = {**CHAIN_DATA, "name": "issuing_chain"}
+        config = ConfigFile(
+            {
+                "chains": [mistyped_chain, dead_chain],
+                "witnesses": [WITNESS_DATA],
+                "bridges": [],
+            }
+        )
+
+        assert [chain.name for chain in config.chains] == ["locking_chain"]
+        assert [witness.name for witness in config.witnesses] == ["witness0"]
+        with open(config_file) as f:
+            data = json.load(f)
+        assert [chain["name"] for chain in data["chains"]] == ["locking_chain"]
+        assert [witness["name"] for witness in data["witnesses"]] == ["witness0"]
+
+    def test_check_running_slow_server(self, monkeypatch):
+        monkeypatch.setattr(config_file_module, "_PROBE_TIMEOUT", 0.2)
+        # accepts connections but never replies
+        with socket.socket() as listener:
+            listener.bind(("127.0.0.1", 0))
+            listener.listen()
+            slow_server = {
+                **CHAIN_DATA,
+                "exe": "docker",
+                "http_port": listener.getsockname()[1],
+            }
+            assert config_file_module._check_running([slow_server]) == [True]
+            assert config_file_module._check_running([slow_server], deep=True) == [True]
+
+    def test_check_running_closed_port(self):
+        with socket.socket() as unused:
+            unused.bind(("127.0.0.1", 0))
+            port = unused.getsockname()[1]
+        closed_server = {**CHAIN_DATA, "http_port": port}
+        assert config_file_module._check_running([closed_server]) == [False]
+        assert config_file_module._check_running([closed_server], deep=True) == [False]
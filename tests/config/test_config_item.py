@@ -0,0 +1,22 @@
+import json
+from dataclasses import asdict
+
+import pytest
+
+from sidechain_cli.utils.config_file import BridgeConfig, ChainConfig, WitnessConfig
+from tests.config.utils import BRIDGE_DATA, CHAIN_DATA, WITNESS_DATA
+
+
+class TestConfigItem:
+    @pytest.mark.parametrize(
+        "cls,data",
+        [
+            (ChainConfig, CHAIN_DATA),
+            (WitnessConfig, WITNESS_DATA),
+            (BridgeConfig, BRIDGE_DATA),
+        ],
+        ids=["ChainConfig", "WitnessConfig", "BridgeConfig"],
+    )
+    def test_to_dict(self, cls, data):
+        config = cls.from_dict(data)
+        assert json.dumps(config.to_dict()) == json.dumps(asdict(config))
@@ -0,0 +1,65 @@
+import json
+import os
+import stat
+
+import pytest
+
+from sidechain_cli.utils.config_file.json_cache import load_json, write_json
+
+
+class TestJsonCache:
+    def test_load_json_unchanged(self, tmp_path):
+        file_name = str(tmp_path / "data.json")
+        with open(file_name, "w") as f:
+            json.dump({"chains": []}, f)
+
+        data = load_json(file_name)
+        assert data == {"chains": []}
+        # the file hasn't changed, so it isn't parsed again
+        assert load_json(file_name) is data
+
+    def test_load_json_outside_write(self, tmp_path):
+        file_name = str(tmp_path / "data.json")
+        with open(file_name, "w") as f:
+            json.dump({"chains": []}, f)
+        load_json(file_name)
+
+        with open(file_name, "w") as f:
+            json.dump({"chains": [], "witnesses": []}, f)
+        assert load_json(file_name) == {"chains": [], "witnesses": []}
+
+    def test_write_json_caches_data(self, tmp_path):
+        file_name = str(tmp_path / "data.json")
+        data = {"chains": [], "witnesses": [], "bridges": []}
+        write_json(file_name, data)
+
+        assert load_json(file_name) is data
+        with open(file_name) as f:
+            assert json.load(f) == data
+
+    def test_write_json_keeps_mode(self, tmp_path):
+        file_name = str(tmp_path / "data.json")
+        write_json(file_name, {"chains": []})
+        os.chmod(file_name, 0o600)
+
+        write_json(file_name, {"chains": [], "witnesses": []})
+        assert stat.S_IMODE(os.stat(file_name).st_mode) == 0o600
+
+    def test_write_json_new_file_mode(self, tmp_path):
+        file_name = str(tmp_path / "data.json")
+        old_umask = os.umask(0o027)
+        try:
+            write_json(file_name, {"chains": []})
+        finally:
+            os.umask(old_umask)
+        assert stat.S_IMODE(os.stat(file_name).st_mode) == 0o640
+
+    def test_write_json_failure(self, tmp_path):
+        file_name = str(tmp_path / "data.json")
+        write_json(file_name, {"chains": []})
+
+        with pytest.raises(TypeError):
+            write_json(file_name, {"chains": [object()]})
+        assert os.listdir(tmp_path) == ["data.json"]
+        with open(file_name) as f:
+            assert json.load(f) == {"chains": []}
@@ -0,0 +1,39 @@
+"""Sample config data shared by the config tests."""
+
+CHAIN_DATA = {
+    "name": "locking_chain",
+    "type": "rippled",
+    "pid": 1234,
+    "exe": "rippled",
+    "config": "/tmp/locking_chain/rippled.cfg",
+    "http_ip": "127.0.0.1",
+    "http_port": 5005,
+    "ws_ip": "127.0.0.1",
+    "ws_port": 6005,
+}
+
+WITNESS_DATA = {
+    "name": "witness0",
+    "type": "witness",
+    "pid": 5678,
+    "exe": "witnessd",
+    "config": "/tmp/witness0/witness.json",
+    "http_ip": "127.0.0.1",
+    "http_port": 6010,
+}
+
+BRIDGE_DATA = {
+    "name": "test_bridge",
+    "chains": ("http://127.0.0.1:5005", "http://127.0.0.1:5006"),
+    "quorum": 4,
+    "door_accounts": (
+        "rHb9CJAWyB4rj91VRWn96DkukG4bwdtyTh",
+        "rGWrZyQqhTp9Xu7G5Pkayo7bXjH4k4QYpf",
+    ),
+    "xchain_currencies": (
+        {"currency": "XRP"},
+        {"currency": "USD", "issuer": "rGWrZyQqhTp9Xu7G5Pkayo7bXjH4k4QYpf"},
+    ),
+    "signature_reward": "100",
+    "create_account_amounts": ("5000000", None),
+}
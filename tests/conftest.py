@@ -1,9 +1,11 @@
+import functools
 import json
 import os
 import tempfile
 import unittest
 import unittest.mock
 from contextlib import contextmanager
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import pytest
@@ -11,6 +13,7 @@ from click.testing import CliRunner
 
 from sidechain_cli.main import main
 from sidechain_cli.utils import get_config_folder
+from sidechain_cli.utils.config_file import config_file as config_file_module
 
 config_dir: Optional[tempfile.TemporaryDirectory] = None
 mocked_home_dir: Optional[tempfile.TemporaryDirectory] = None
@@ -24,14 +27,33 @@ def _is_docker():
     )
 
 
+def _has_servers() -> bool:
+    """Whether the CLI config file has any chains or witnesses in it."""
+    # don't use `get_config_folder`, since that creates the config file
+    config_file = config_file_module._CONFIG_FILE
+    if not os.path.exists(config_file):
+        return False
+    try:
+        with open(config_file) as f:
+            data = json.load(f)
+        return len(data["chains"]) > 0 or len(data["witnesses"]) > 0
+    except (OSError, ValueError, KeyError):
+        # let the stop command deal with a malformed config, like it used to
+        return True
+
+
 def pytest_configure(config):
     """
     Called after the Session object has been created and
     before performing collection and entering the run test loop.
     """
     global mocked_home_dir, config_dir, mocked_vars
-    runner = CliRunner()
-    runner.invoke(main, ["server", "stop", "--all"])
+    # This runs before the config is mocked below, so it stops (and removes from the
+    # real config file) any servers recorded in the real CLI config.
+    # CI runners start out with no servers running, so there's nothing to stop.
+    if os.getenv("GITHUB_CI") != "True" and _has_servers():
+        runner = CliRunner()
+        runner.invoke(main, ["server", "stop", "--all"])
 
     if os.getenv("GITHUB_CI") != "True":
         config_dir = tempfile.TemporaryDirectory()
@@ -94,22 +116,28 @@ def _create_config_files() -> None:
     assert result.exit_code == 0, result.output
 
 
+@functools.lru_cache(maxsize=1)
+def _load_bootstrap(bootstrap_file: str, mtime: float) -> Dict[str, Any]:
+    # `mtime` is only part of the cache key, so that regenerated files are re-read
+    return json.loads(Path(bootstrap_file).read_bytes())
+
+
 def _fund_locking_accounts(cli_runner: CliRunner) -> None:
     raw_xchain_config_dir = os.getenv("XCHAIN_CONFIG_DIR")
     if raw_xchain_config_dir is None:
         raise Exception("Error: $XCHAIN_CONFIG_DIR is not defined.")
     xchain_config_dir = os.path.abspath(raw_xchain_config_dir)
-    with open(os.path.join(xchain_config_dir, "bridge_bootstrap.json")) as f:
-        bootstrap = json.load(f)
+    bootstrap_file = os.path.join(xchain_config_dir, "bridge_bootstrap.json")
+    bootstrap = _load_bootstrap(bootstrap_file, os.path.getmtime(bootstrap_file))
 
     locking_door = bootstrap["LockingChain"]["DoorAccount"]["Address"]
 
     # fund needed accounts on the locking chain
-    accounts_locking_fund = set(
-        [locking_door]
-        + bootstrap["LockingChain"]["WitnessRewardAccounts"]
-        + bootstrap["LockingChain"]["WitnessSubmitAccounts"]
-    )
+    accounts_locking_fund = {
+        locking_door,
+        *bootstrap["LockingChain"]["WitnessRewardAccounts"],
+        *bootstrap["LockingChain"]["WitnessSubmitAccounts"],
+    }
     fund_result = cli_runner.invoke(
         main, ["fund", "locking_chain", *accounts_locking_fund]
     )